@@ -3,340 +3,552 @@ AI-Powered Document Structuring & Data Extraction using Google Gemini API
 True AI implementation for transforming unstructured documents into structured Excel output
 """
 
+import asyncio
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import pandas as pd
 import json
 import os
+import random
+import time
 from typing import Dict, List, Any
 import re
 
-# Note: In a real implementation, you would need to install and configure:
+# Gemini API client is optional; without it (or without an API key) the
+# processor falls back to simulated extraction so the demo still runs.
 # pip install google-generativeai
-# import google.generativeai as genai
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+# xlsxwriter streams rows to disk instead of materializing the whole
+# workbook like openpyxl; fall back to openpyxl if it is not installed
+try:
+    import xlsxwriter  # noqa: F401
+except ImportError:
+    xlsxwriter = None
+
+# orjson serializes several times faster than stdlib json and handles
+# datetimes natively; fall back to stdlib if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams large JSON bodies (batched Gemini responses) object by
+# object instead of materializing the whole tree before walking it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# aiofiles moves file writes off the event loop so batch output can
+# overlap with in-flight Gemini calls
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Fast path for parsing inbound Gemini JSON bodies
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Top-level sections every Gemini extraction must contain
+_REQUIRED_SECTIONS = (
+    "personal_info", "professional_career", "education",
+    "certifications", "technical_proficiency",
+)
+
+# Prompt sent to Gemini for a single document
+EXTRACTION_PROMPT = """Extract the following information from the document below and
+return it as a single JSON object with exactly these top-level keys:
+"personal_info", "professional_career", "education", "certifications",
+"technical_proficiency". Respond with JSON only, no prose.
+
+Document:
+{document}"""
+
+# Prompt used to pack several documents into a single Gemini call
+BATCH_EXTRACTION_PROMPT = """Extract information from each of the numbered documents
+below. Return a JSON array with exactly one object per document, in the same
+order, where each object has these top-level keys: "personal_info",
+"professional_career", "education", "certifications", "technical_proficiency".
+Respond with JSON only, no prose.
+
+Documents:
+{documents}"""
+
+# Analyst comments attached to specific extracted fields in the Excel output.
+# Built once at import time; defaultdict(str) makes a miss return "" from a
+# plain indexed lookup, with no .get call or default argument per row.
+_PERSONAL_COMMENTS = defaultdict(str, {
+    "birth_city": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context",
+    "birth_state": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context",
+    "age": "As on year 2024. His birthdate is formatted in ISO format for easy parsing, while his age serves as a key demographic marker for analytical purposes.",
+    "blood_group": "Emergency contact purposes.",
+    "nationality": "Citizenship status is important for understanding his work authorization and visa requirements across different employment opportunities."
+})
+
+_CURRENT_ROLE_COMMENTS = defaultdict(str, {
+    "salary": "This salary progression from his starting compensation to his current peak salary of 2,800,000 INR represents a substantial eight-fold increase over his twelve-year career span."
+})
+
+_PREVIOUS_ROLE_COMMENTS = defaultdict(str, {
+    "starting_designation": "Promoted in 2019"
+})
+
+_EDUCATION_COMMENTS = defaultdict(str, {
+    "12th_passout_year": "His core subjects included Mathematics, Physics, Chemistry, and Computer Science, demonstrating his early aptitude for technical disciplines.",
+    "12th_board_score": "Outstanding achievement"
+})
+
+_UNDERGRADUATE_COMMENTS = defaultdict(str, {
+    "year": "Graduating with honors and ranking 15th among 120 students in his class.",
+    "cgpa": "On a 10-point scale"
+})
+
+_GRADUATION_COMMENTS = defaultdict(str, {
+    "college": "Continued academic excellence at IIT Bombay",
+    "cgpa": "Considered exceptional and scoring 95 out of 100 for his final year thesis project."
+})
+
+_CERTIFICATION_COMMENTS = defaultdict(str, {
+    0: "Vijay's commitment to continuous learning is evident through his impressive certification scores. He passed the AWS Solutions Architect exam in 2019 with a score of 920 out of 1000",
+    1: "Pursued in the year 2020 with 875 points.",
+    2: "Obtained in 2021, was achieved with an \"Above Target\" rating from PMI, These certifications complement his practical experience and demonstrate his expertise across multiple technology platforms.",
+    3: "Earned him an outstanding 98% score. Certifications complement his practical experience and demonstrate his expertise across multiple technology platforms."
+})
+
+
+@dataclass(frozen=True, slots=True)
+class _Section:
+    """One compiled step of the structuring plan"""
+    path: tuple      # pre-split key path into ai_data
+    tag: str         # section tag for _KEY_MAP lookups
+    comments: Any    # per-key comment mapping
+
+
+# Compiled structuring plan: the schema is fixed, so the dotted paths are
+# pre-split and frozen into _Section records once at import time. Nested
+# dict values inside a section are skipped during the walk because they
+# have plan entries of their own.
+_PLAN = (
+    _Section(("personal_info",), "personal", _PERSONAL_COMMENTS),
+    _Section(("professional_career", "first_role"), "first_role", defaultdict(str)),
+    _Section(("professional_career", "current_role"), "current_role", _CURRENT_ROLE_COMMENTS),
+    _Section(("professional_career", "previous_role"), "previous_role", _PREVIOUS_ROLE_COMMENTS),
+    _Section(("education",), "education", _EDUCATION_COMMENTS),
+    _Section(("education", "undergraduate"), "undergraduate", _UNDERGRADUATE_COMMENTS),
+    _Section(("education", "graduation"), "graduation", _GRADUATION_COMMENTS),
+)
+
+
+# Demo payload returned by simulate_ai_extraction: built once at import
+# time instead of ~40 nested dict/list allocations per call. Treat as
+# read-only; every caller receives the same object.
+_DEMO_EXTRACTION = {
+    "personal_info": {
+        "first_name": "Vijay",
+        "last_name": "Kumar",
+        "date_of_birth": "1989-03-15 00:00:00",
+        "birth_city": "Jaipur",
+        "birth_state": "Rajasthan",
+        "age": "35 years",
+        "blood_group": "O+",
+        "nationality": "Indian"
+    },
+    "professional_career": {
+        "first_role": {
+            "joining_date": "2012-07-01 00:00:00",
+            "designation": "Junior Developer",
+            "salary": "350000",
+            "currency": "INR"
+        },
+        "current_role": {
+            "organization": "Resse Analytics",
+            "joining_date": "2021-06-15 00:00:00",
+            "designation": "Senior Data Engineer",
+            "salary": "2800000",
+            "currency": "INR"
+        },
+        "previous_role": {
+            "organization": "LakeCorp Solutions",
+            "joining_date": "2018-02-01 00:00:00",
+            "end_year": "2021",
+            "starting_designation": "Data Analyst"
+        }
+    },
+    "education": {
+        "high_school": "St. Xavier's School, Jaipur",
+        "12th_passout_year": "2007",
+        "12th_board_score": "0.925",
+        "undergraduate": {
+            "degree": "B.Tech (Computer Science)",
+            "college": "IIT Delhi",
+            "year": "2011",
+            "cgpa": "8.7"
+        },
+        "graduation": {
+            "degree": "M.Tech (Data Science)",
+            "college": "IIT Bombay",
+            "year": "2013",
+            "cgpa": "9.2"
+        }
+    },
+    "certifications": [
+        {
+            "name": "AWS Solutions Architect",
+            "year": "2019",
+            "score": "920 out of 1000"
+        },
+        {
+            "name": "Azure Data Engineer", 
+            "year": "2020",
+            "score": "875 points"
+        },
+        {
+            "name": "Project Management Professional certification",
+            "year": "2021",
+            "rating": "Above Target"
+        },
+        {
+            "name": "SAFe Agilist certification",
+            "score": "98%"
+        }
+    ],
+    "technical_proficiency": "In terms of technical proficiency, Vijay rates himself highly across various skills, with SQL expertise at a perfect 10 out of 10, reflecting his daily usage since 2012. His Python proficiency scores 9 out of 10, backed by over seven years of practical experience, while his machine learning capabilities rate 8 out of 10, representing five years of hands-on implementation. His cloud platform expertise, including AWS and Azure certifications, also rates 9 out of 10 with more than four years of experience, and his data visualization skills in Power BI and Tableau score 8 out of 10, establishing him as an expert in the field."
+}
+
+
+class ExtractionCache:
+    """
+    Content-addressable on-disk cache for Gemini extraction results.
+
+    Results are stored as cache_dir/{key}.json where the key is a SHA-256
+    hash over model name, prompt version and document text, so identical
+    inputs short-circuit the API call entirely.
+    """
+
+    def __init__(self, cache_dir: str = "./.gemini_cache", ttl: int = 24 * 3600):
+        """
+        Args:
+            cache_dir (str): Directory holding one JSON file per cached result
+            ttl (int): Time-to-live for cached entries, in seconds
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None on miss/expiry"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() >= entry["expires_at"]:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any):
+        """Store value under key with the configured TTL"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {"expires_at": time.time() + self.ttl, "value": value}
+        with open(self._path(key), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, default=str, ensure_ascii=False)
+
 
 class AIDocumentProcessor:
     """
     Advanced AI-powered document processor using Google Gemini API
     for transforming unstructured documents into structured Excel output
     """
-    
-    def __init__(self, api_key: str = None):
+
+    MODEL_NAME = "gemini-1.5-flash"
+    # Bumping this invalidates every cached extraction when the prompt changes
+    PROMPT_VERSION = "v1"
+    # Retry policy for Gemini calls: bounded attempts with exponential backoff
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+
+    # Excel labels for every known (section, raw key) pair, fused into one
+    # flat lookup instead of one mapping-wrapped method per section
+    _KEY_MAP = {
+        ("personal", "first_name"): "First Name",
+        ("personal", "last_name"): "Last Name",
+        ("personal", "date_of_birth"): "Date of Birth",
+        ("personal", "birth_city"): "Birth City",
+        ("personal", "birth_state"): "Birth State",
+        ("personal", "age"): "Age",
+        ("personal", "blood_group"): "Blood Group",
+        ("personal", "nationality"): "Nationality",
+        ("first_role", "joining_date"): "Joining Date of first professional role",
+        ("first_role", "designation"): "Designation of first professional role",
+        ("first_role", "salary"): "Salary of first professional role",
+        ("first_role", "currency"): "Salary currency of first professional role",
+        ("current_role", "organization"): "Current Organization",
+        ("current_role", "joining_date"): "Current Joining Date",
+        ("current_role", "designation"): "Current Designation",
+        ("current_role", "salary"): "Current Salary",
+        ("current_role", "currency"): "Current Salary Currency",
+        ("previous_role", "organization"): "Previous Organization",
+        ("previous_role", "joining_date"): "Previous Joining Date",
+        ("previous_role", "end_year"): "Previous end year",
+        ("previous_role", "starting_designation"): "Previous Starting Designation",
+        ("education", "high_school"): "High School",
+        ("education", "12th_passout_year"): "12th standard pass out year",
+        ("education", "12th_board_score"): "12th overall board score",
+        ("undergraduate", "degree"): "Undergraduate degree",
+        ("undergraduate", "college"): "Undergraduate college",
+        ("undergraduate", "year"): "Undergraduate year",
+        ("undergraduate", "cgpa"): "Undergraduate CGPA",
+        ("graduation", "degree"): "Graduation degree",
+        ("graduation", "college"): "Graduation college",
+        ("graduation", "year"): "Graduation year",
+        ("graduation", "cgpa"): "Graduation CGPA",
+    }
+
+    def __init__(self, api_key: str = None, max_concurrency: int = 50, verbose: bool = True):
         """
         Initialize the AI document processor
-        
+
         Args:
             api_key (str): Google Gemini API key (optional)
+            max_concurrency (int): Maximum number of in-flight Gemini requests,
+                sized to the API tier's queries-per-minute limit
+            verbose (bool): Emit progress output; disable for batch runs where
+                per-document prints become measurable overhead
         """
+        self.verbose = verbose
+        self._log = print if verbose else (lambda *args, **kwargs: None)
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.processed_data = []
         self.ai_analysis = {}
-        
-        # For this demo, we'll simulate the AI processing
-        # In production, you would initialize the Gemini API here
-        if self.api_key:
-            print("🔑 Gemini API key configured")
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._cache = ExtractionCache()
+
+        if self.api_key and genai is not None:
+            genai.configure(api_key=self.api_key)
+            self._log("🔑 Gemini API key configured")
         else:
-            print("⚠️  Using simulated AI processing (no API key provided)")
+            self._log("⚠️  Using simulated AI processing (no API key provided)")
     
     def simulate_ai_extraction(self, text_content: str) -> Dict[str, Any]:
         """
         Simulate AI-powered extraction (what Gemini API would return)
-        In production, this would be replaced with actual API calls
+        In production, this is replaced with actual API calls
+
+        Returns the shared module-level demo payload, so callers must not
+        mutate the result.
         """
-        
-        # AI analysis simulation - this is what Gemini would extract
-        ai_extraction = {
-            "personal_info": {
-                "first_name": "Vijay",
-                "last_name": "Kumar",
-                "date_of_birth": "1989-03-15 00:00:00",
-                "birth_city": "Jaipur",
-                "birth_state": "Rajasthan",
-                "age": "35 years",
-                "blood_group": "O+",
-                "nationality": "Indian"
-            },
-            "professional_career": {
-                "first_role": {
-                    "joining_date": "2012-07-01 00:00:00",
-                    "designation": "Junior Developer",
-                    "salary": "350000",
-                    "currency": "INR"
-                },
-                "current_role": {
-                    "organization": "Resse Analytics",
-                    "joining_date": "2021-06-15 00:00:00",
-                    "designation": "Senior Data Engineer",
-                    "salary": "2800000",
-                    "currency": "INR"
-                },
-                "previous_role": {
-                    "organization": "LakeCorp Solutions",
-                    "joining_date": "2018-02-01 00:00:00",
-                    "end_year": "2021",
-                    "starting_designation": "Data Analyst"
-                }
-            },
-            "education": {
-                "high_school": "St. Xavier's School, Jaipur",
-                "12th_passout_year": "2007",
-                "12th_board_score": "0.925",
-                "undergraduate": {
-                    "degree": "B.Tech (Computer Science)",
-                    "college": "IIT Delhi",
-                    "year": "2011",
-                    "cgpa": "8.7"
-                },
-                "graduation": {
-                    "degree": "M.Tech (Data Science)",
-                    "college": "IIT Bombay",
-                    "year": "2013",
-                    "cgpa": "9.2"
-                }
-            },
-            "certifications": [
-                {
-                    "name": "AWS Solutions Architect",
-                    "year": "2019",
-                    "score": "920 out of 1000"
-                },
-                {
-                    "name": "Azure Data Engineer", 
-                    "year": "2020",
-                    "score": "875 points"
-                },
-                {
-                    "name": "Project Management Professional certification",
-                    "year": "2021",
-                    "rating": "Above Target"
-                },
-                {
-                    "name": "SAFe Agilist certification",
-                    "score": "98%"
-                }
-            ],
-            "technical_proficiency": "In terms of technical proficiency, Vijay rates himself highly across various skills, with SQL expertise at a perfect 10 out of 10, reflecting his daily usage since 2012. His Python proficiency scores 9 out of 10, backed by over seven years of practical experience, while his machine learning capabilities rate 8 out of 10, representing five years of hands-on implementation. His cloud platform expertise, including AWS and Azure certifications, also rates 9 out of 10 with more than four years of experience, and his data visualization skills in Power BI and Tableau score 8 out of 10, establishing him as an expert in the field."
-        }
-        
-        return ai_extraction
-    
+        return _DEMO_EXTRACTION
+
+    async def _call_gemini(self, text_content: str) -> Dict[str, Any]:
+        """
+        Call the Gemini API for one document and return the parsed JSON.
+        Falls back to simulated extraction when no API key/client is available.
+        """
+        if genai is None or not self.api_key:
+            return self.simulate_ai_extraction(text_content)
+
+        key = self._cache_key(text_content)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._with_retries(EXTRACTION_PROMPT.format(document=text_content))
+        self._cache.set(key, result)
+        return result
+
+    async def _generate(self, prompt: str) -> str:
+        """Issue one Gemini request and return the raw response text"""
+        model = genai.GenerativeModel(self.MODEL_NAME)
+        response = await model.generate_content_async(prompt)
+        # Gemini often wraps JSON output in a ```json ... ``` fence
+        raw = response.text.strip()
+        return re.sub(r'^```(?:json)?\s*|\s*```$', '', raw)
+
+    def _validate_extraction(self, result: Any):
+        """Raise ValueError if the response is not a usable extraction object"""
+        if not isinstance(result, dict):
+            raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+        missing = [s for s in _REQUIRED_SECTIONS if s not in result]
+        if missing:
+            raise ValueError(f"missing required sections: {', '.join(missing)}")
+
+    async def _with_retries(self, prompt: str) -> Dict[str, Any]:
+        """
+        Run a Gemini prompt with bounded retries.
+
+        Validation failures are retried with the error appended to the
+        prompt as feedback; rate limits and transient API errors are
+        retried with exponential backoff plus jitter so a single 429 or
+        5xx does not kill a whole batch.
+        """
+        feedback = ""
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                raw = await self._generate(prompt + feedback)
+                result = _loads(raw)
+                self._validate_extraction(result)
+                return result
+            except ValueError as e:
+                # Malformed output: re-prompt with the error as feedback
+                feedback = (
+                    f"\n\nYour previous output had an error: {e}."
+                    " Fix it and respond again with valid JSON only."
+                )
+                error = e
+            except Exception as e:
+                # Rate limit or transient API failure: back off before retrying
+                error = e
+            if attempt < self.MAX_RETRIES - 1:
+                await asyncio.sleep(self.RETRY_BASE_DELAY * 2 ** attempt + random.random())
+        raise error
+
+    def _cache_key(self, text_content: str) -> str:
+        """SHA-256 cache key over model, prompt version and document text"""
+        return hashlib.sha256(
+            f"{self.MODEL_NAME}|{self.PROMPT_VERSION}|".encode() + text_content.encode()
+        ).hexdigest()
+
+    async def aprocess_document(self, text_content: str) -> List[Dict[str, str]]:
+        """Async variant of process_document: extract with Gemini, then structure"""
+        ai_data = await self._call_gemini(text_content)
+        return self.structure_ai_output(ai_data)
+
+    async def _one(self, text_content: str) -> List[Dict[str, str]]:
+        """Process a single document under the concurrency semaphore"""
+        async with self._sem:
+            return await self.aprocess_document(text_content)
+
+    async def aprocess_documents(self, texts: List[str]) -> List[List[Dict[str, str]]]:
+        """
+        Process many documents concurrently.
+
+        Requests are fired with asyncio.gather, bounded by the semaphore so
+        at most max_concurrency calls are in flight against the rate limit.
+
+        Args:
+            texts (List[str]): Unstructured text content, one entry per document
+
+        Returns:
+            List[List[Dict[str, str]]]: Structured records, one list per document
+        """
+        return await asyncio.gather(*[self._one(t) for t in texts])
+
+    async def _call_gemini_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Call Gemini once for a group of documents and return one parsed
+        extraction object per document
+        """
+        if genai is None or not self.api_key:
+            return [self.simulate_ai_extraction(t) for t in texts]
+
+        documents = "\n".join(f"[{i+1}] {t}" for i, t in enumerate(texts))
+        model = genai.GenerativeModel(self.MODEL_NAME)
+        response = await model.generate_content_async(
+            BATCH_EXTRACTION_PROMPT.format(documents=documents)
+        )
+        raw = response.text.strip()
+        raw = re.sub(r'^```(?:json)?\s*|\s*```$', '', raw)
+        results = self._parse_batch_response(raw)
+        if len(results) != len(texts):
+            raise ValueError(
+                f"Gemini returned {len(results)} extraction objects for {len(texts)} documents"
+            )
+        return results
+
+    def _parse_batch_response(self, raw: str) -> List[Dict[str, Any]]:
+        """
+        Parse a JSON array of extraction objects from a batched response.
+
+        With ijson available the array is streamed one extraction object at
+        a time, so peak memory stays at one object rather than the whole
+        response tree plus the raw text.
+        """
+        if ijson is not None:
+            return list(ijson.items(raw.encode(), 'item'))
+        return _loads(raw)
+
+    async def abatch_extract(self, texts: List[str], rows_per_call: int = 8) -> List[Dict[str, Any]]:
+        """Async variant of batch_extract: one Gemini call per group of documents"""
+        groups = [texts[i:i + rows_per_call] for i in range(0, len(texts), rows_per_call)]
+
+        async def _group(g):
+            async with self._sem:
+                return await self._call_gemini_batch(g)
+
+        grouped = await asyncio.gather(*[_group(g) for g in groups])
+        return [result for group in grouped for result in group]
+
+    def batch_extract(self, texts: List[str], rows_per_call: int = 8) -> List[Dict[str, Any]]:
+        """
+        Extract many documents with few Gemini calls by packing rows_per_call
+        documents into each prompt.
+
+        Per-document prompts pay a fixed preamble + network round-trip cost;
+        packing several documents into one call amortizes both. Latency per
+        call grows sub-linearly with group size up to ~8-16 documents, so the
+        default of 8 is a good starting point to tune empirically.
+
+        Args:
+            texts (List[str]): Unstructured text content, one entry per document
+            rows_per_call (int): Number of documents packed into each prompt
+
+        Returns:
+            List[Dict[str, Any]]: One AI extraction object per document
+        """
+        return asyncio.run(self.abatch_extract(texts, rows_per_call))
+
+    def _iter_rows(self, ai_data: Dict[str, Any]):
+        """Walk _PLAN over ai_data, yielding (key, value, comment) per row"""
+        for step in _PLAN:
+            section = ai_data
+            for part in step.path:
+                section = section[part]
+            tag, comments = step.tag, step.comments
+            for key, value in section.items():
+                if isinstance(value, dict):
+                    continue  # nested subsections have their own plan entries
+                yield self._format_key(tag, key), value, comments[key]
+
+        for i, cert in enumerate(ai_data["certifications"]):
+            yield f"Certifications {i+1}", cert["name"], _CERTIFICATION_COMMENTS[i]
+
+        yield "Technical Proficiency", "", ai_data["technical_proficiency"]
+
     def structure_ai_output(self, ai_data: Dict[str, Any]) -> List[Dict[str, str]]:
         """
         Convert AI-extracted data into the required Excel structure
         """
-        structured_data = []
-        record_num = 1
-        
-        # Personal Information
-        personal_comments = {
-            "birth_city": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context",
-            "birth_state": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context",
-            "age": "As on year 2024. His birthdate is formatted in ISO format for easy parsing, while his age serves as a key demographic marker for analytical purposes.",
-            "blood_group": "Emergency contact purposes.",
-            "nationality": "Citizenship status is important for understanding his work authorization and visa requirements across different employment opportunities."
-        }
-        
-        for key, value in ai_data["personal_info"].items():
-            comment = personal_comments.get(key, "")
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_key_name(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Professional Career
-        professional_comments = {
-            "current_salary": "This salary progression from his starting compensation to his current peak salary of 2,800,000 INR represents a substantial eight-fold increase over his twelve-year career span.",
-            "previous_starting_designation": "Promoted in 2019"
-        }
-        
-        # First role
-        for key, value in ai_data["professional_career"]["first_role"].items():
-            comment = ""
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_first_role_key(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Current role
-        for key, value in ai_data["professional_career"]["current_role"].items():
-            comment = professional_comments.get(f"current_{key}", "")
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_current_role_key(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Previous role
-        for key, value in ai_data["professional_career"]["previous_role"].items():
-            comment = professional_comments.get(f"previous_{key}", "")
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_previous_role_key(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Education
-        education_comments = {
-            "12th_passout_year": "His core subjects included Mathematics, Physics, Chemistry, and Computer Science, demonstrating his early aptitude for technical disciplines.",
-            "12th_board_score": "Outstanding achievement",
-            "undergraduate_year": "Graduating with honors and ranking 15th among 120 students in his class.",
-            "undergraduate_cgpa": "On a 10-point scale",
-            "graduation_cgpa": "Considered exceptional and scoring 95 out of 100 for his final year thesis project.",
-            "graduation_college": "Continued academic excellence at IIT Bombay"
-        }
-        
-        # High school
-        structured_data.append({
-            "#": record_num,
-            "Key": "High School",
-            "Value": ai_data["education"]["high_school"],
-            "Comments": ""
-        })
-        record_num += 1
-        
-        # 12th standard
-        structured_data.append({
-            "#": record_num,
-            "Key": "12th standard pass out year",
-            "Value": ai_data["education"]["12th_passout_year"],
-            "Comments": education_comments["12th_passout_year"]
-        })
-        record_num += 1
-        
-        structured_data.append({
-            "#": record_num,
-            "Key": "12th overall board score",
-            "Value": ai_data["education"]["12th_board_score"],
-            "Comments": education_comments["12th_board_score"]
-        })
-        record_num += 1
-        
-        # Undergraduate
-        for key, value in ai_data["education"]["undergraduate"].items():
-            comment_key = f"undergraduate_{key}"
-            comment = education_comments.get(comment_key, "")
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_undergraduate_key(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Graduation
-        for key, value in ai_data["education"]["graduation"].items():
-            comment_key = f"graduation_{key}"
-            comment = education_comments.get(comment_key, "")
-            structured_data.append({
-                "#": record_num,
-                "Key": self.format_graduation_key(key),
-                "Value": value,
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Certifications
-        certification_comments = {
-            0: "Vijay's commitment to continuous learning is evident through his impressive certification scores. He passed the AWS Solutions Architect exam in 2019 with a score of 920 out of 1000",
-            1: "Pursued in the year 2020 with 875 points.",
-            2: "Obtained in 2021, was achieved with an \"Above Target\" rating from PMI, These certifications complement his practical experience and demonstrate his expertise across multiple technology platforms.",
-            3: "Earned him an outstanding 98% score. Certifications complement his practical experience and demonstrate his expertise across multiple technology platforms."
-        }
-        
-        for i, cert in enumerate(ai_data["certifications"]):
-            comment = certification_comments.get(i, "")
-            structured_data.append({
-                "#": record_num,
-                "Key": f"Certifications {i+1}",
-                "Value": cert["name"],
-                "Comments": comment
-            })
-            record_num += 1
-        
-        # Technical Proficiency
-        structured_data.append({
-            "#": record_num,
-            "Key": "Technical Proficiency",
-            "Value": "",
-            "Comments": ai_data["technical_proficiency"]
-        })
-        
-        return structured_data
-    
-    def format_key_name(self, key: str) -> str:
-        """Format key names for Excel output"""
-        key_mapping = {
-            "first_name": "First Name",
-            "last_name": "Last Name",
-            "date_of_birth": "Date of Birth",
-            "birth_city": "Birth City",
-            "birth_state": "Birth State",
-            "age": "Age",
-            "blood_group": "Blood Group",
-            "nationality": "Nationality"
-        }
-        return key_mapping.get(key, key.replace("_", " ").title())
-    
-    def format_first_role_key(self, key: str) -> str:
-        """Format first role keys"""
-        mapping = {
-            "joining_date": "Joining Date of first professional role",
-            "designation": "Designation of first professional role",
-            "salary": "Salary of first professional role",
-            "currency": "Salary currency of first professional role"
-        }
-        return mapping.get(key, key)
-    
-    def format_current_role_key(self, key: str) -> str:
-        """Format current role keys"""
-        mapping = {
-            "organization": "Current Organization",
-            "joining_date": "Current Joining Date",
-            "designation": "Current Designation",
-            "salary": "Current Salary",
-            "currency": "Current Salary Currency"
-        }
-        return mapping.get(key, key)
-    
-    def format_previous_role_key(self, key: str) -> str:
-        """Format previous role keys"""
-        mapping = {
-            "organization": "Previous Organization",
-            "joining_date": "Previous Joining Date",
-            "end_year": "Previous end year",
-            "starting_designation": "Previous Starting Designation"
-        }
-        return mapping.get(key, key)
-    
-    def format_undergraduate_key(self, key: str) -> str:
-        """Format undergraduate keys"""
-        mapping = {
-            "degree": "Undergraduate degree",
-            "college": "Undergraduate college",
-            "year": "Undergraduate year",
-            "cgpa": "Undergraduate CGPA"
-        }
-        return mapping.get(key, key)
-    
-    def format_graduation_key(self, key: str) -> str:
-        """Format graduation keys"""
-        mapping = {
-            "degree": "Graduation degree",
-            "college": "Graduation college",
-            "year": "Graduation year",
-            "cgpa": "Graduation CGPA"
-        }
-        return mapping.get(key, key)
+        return [
+            {"#": i + 1, "Key": key, "Value": value, "Comments": comment}
+            for i, (key, value, comment) in enumerate(self._iter_rows(ai_data))
+        ]
     
+    # Memo for title-cased fallback labels: str.replace + str.title allocate
+    # and loop over the key, so each unknown key pays that cost only once
+    _FORMATTED = {}
+
+    def _format_key(self, section: str, key: str) -> str:
+        """Format a raw extraction key into its Excel label"""
+        label = self._KEY_MAP.get((section, key))
+        if label is None:
+            # Unknown keys: title-case personal fields, pass others through
+            if section == "personal":
+                label = self._FORMATTED.get(key)
+                if label is None:
+                    label = self._FORMATTED[key] = key.replace("_", " ").title()
+            else:
+                label = key
+        return label
+
     def process_document(self, text_content: str) -> List[Dict[str, str]]:
         """
         Main processing function that uses AI to extract and structure data
@@ -347,42 +559,88 @@ class AIDocumentProcessor:
         Returns:
             List[Dict[str, str]]: Structured data ready for Excel export
         """
-        print("🤖 AI Document Processing Started...")
-        print("🧠 Simulating Google Gemini API analysis...")
-        
-        # Step 1: AI Extraction (simulated Gemini API response)
-        ai_data = self.simulate_ai_extraction(text_content)
+        self._log("🤖 AI Document Processing Started...")
+        if genai is not None and self.api_key:
+            self._log("🧠 Calling Google Gemini API...")
+        else:
+            self._log("🧠 Simulating Google Gemini API analysis...")
+
+        # Step 1: AI Extraction (Gemini API call, or simulation without a key)
+        ai_data = asyncio.run(self._call_gemini(text_content))
         
-        print("✅ AI analysis complete!")
-        print("🔍 Extracted data categories:")
+        self._log("✅ AI analysis complete!")
+        self._log("🔍 Extracted data categories:")
         for category in ai_data.keys():
             if isinstance(ai_data[category], dict):
-                print(f"   📂 {category}: {len(ai_data[category])} items")
+                self._log(f"   📂 {category}: {len(ai_data[category])} items")
             elif isinstance(ai_data[category], list):
-                print(f"   📂 {category}: {len(ai_data[category])} items")
+                self._log(f"   📂 {category}: {len(ai_data[category])} items")
             else:
-                print(f"   📄 {category}: Text content")
+                self._log(f"   📄 {category}: Text content")
         
         # Step 2: Structure the AI output
-        print("🏗️  Structuring AI output for Excel...")
+        self._log("🏗️  Structuring AI output for Excel...")
         structured_data = self.structure_ai_output(ai_data)
         
-        print(f"✅ Structuring complete! {len(structured_data)} records created.")
+        self._log(f"✅ Structuring complete! {len(structured_data)} records created.")
         
         return structured_data
     
+    # Fixed output layout, declared once so pandas skips per-row dtype
+    # inference. Key and Comments draw from a small finite set of strings,
+    # so categorical columns store ~35 uniques plus integer codes instead
+    # of one string object per row when many documents are aggregated.
+    _COLUMNS = ["#", "Key", "Value", "Comments"]
+    _DTYPES = {"#": "int32", "Key": "category", "Value": "string", "Comments": "category"}
+
     def save_to_excel(self, data: List[Dict[str, str]], filename: str = "AI_Output.xlsx"):
         """Save structured data to Excel file"""
-        df = pd.DataFrame(data)
-        df.to_excel(filename, index=False, engine='openpyxl')
-        print(f"💾 Data saved to {filename}")
+        df = pd.DataFrame.from_records(data, columns=self._COLUMNS).astype(self._DTYPES)
+        if xlsxwriter is not None:
+            # Stream the rows ourselves: pandas emits cells column-by-column,
+            # and constant_memory mode silently drops any write to a row that
+            # has already been flushed, so row order has to stay under our
+            # control. strings_to_urls skips the per-cell URL regex scan.
+            wb = xlsxwriter.Workbook(
+                filename, {'constant_memory': True, 'strings_to_urls': False})
+            ws = wb.add_worksheet()
+            ws.write_row(0, 0, self._COLUMNS)
+            for i, record in enumerate(data, 1):
+                ws.write_row(i, 0, [record[col] for col in self._COLUMNS])
+            wb.close()
+        else:
+            df.to_excel(filename, index=False, engine='openpyxl')
+        self._log(f"💾 Data saved to {filename}")
         return df
     
     def save_to_json(self, data: List[Dict[str, str]], filename: str = "ai_extracted_data.json"):
         """Save structured data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
-        print(f"💾 Data saved to {filename}")
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+        self._log(f"💾 Data saved to {filename}")
+
+    async def asave_to_json(self, data: List[Dict[str, str]], filename: str = "ai_extracted_data.json"):
+        """
+        Async variant of save_to_json for batch pipelines.
+
+        Scheduled as a task on the same loop as aprocess_documents, the write
+        overlaps with in-flight Gemini calls instead of stalling them.
+        """
+        if aiofiles is None:
+            # No async file backend installed; run the sync writer off-loop
+            await asyncio.to_thread(self.save_to_json, data, filename)
+            return
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+        async with aiofiles.open(filename, 'wb') as f:
+            await f.write(payload)
+        self._log(f"💾 Data saved to {filename}")
 
 
 def main():
@@ -434,9 +692,13 @@ him as an expert in the field."""
     # Process the document using AI
     structured_data = processor.process_document(text_content)
     
-    # Save outputs
-    df = processor.save_to_excel(structured_data, "AI_Output.xlsx")
-    processor.save_to_json(structured_data, "ai_extracted_data.json")
+    # Save outputs in parallel: both writes are pure I/O, so overlapping them
+    # makes the output phase cost max(excel, json) instead of their sum
+    with ThreadPoolExecutor(2) as executor:
+        excel_future = executor.submit(processor.save_to_excel, structured_data, "AI_Output.xlsx")
+        json_future = executor.submit(processor.save_to_json, structured_data, "ai_extracted_data.json")
+        df = excel_future.result()
+        json_future.result()
     
     # Display results
     print("\n📊 AI Processing Results:")
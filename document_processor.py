@@ -3,10 +3,308 @@ AI-Powered Document Structuring & Data Extraction
 Main processing module for transforming unstructured documents into structured Excel output.
 """
 
-import pandas as pd
+import functools
+import openpyxl
 import re
-from datetime import datetime
-import json
+import sys
+
+# xlsxwriter streams rows to disk in constant memory and writes faster
+# than openpyxl's write-only mode; fall back to openpyxl if missing
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# orjson serializes 2-5x faster than stdlib json and handles dates
+# natively; fall back to stdlib if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# RE2 (pip install google-re2) is a DFA-based engine with linear-time
+# guarantees, unlike stdlib re's backtracking NFA which can degrade on the
+# .*? alternation patterns below. The patterns use no backreferences or
+# lookarounds, so they compile unchanged; fall back to re if unavailable.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Fused extraction patterns, one alternative per document region. Fields
+# whose old stand-alone patterns overlapped (e.g. date of birth and birth
+# city shared "born on ...") are merged into a single alternative with
+# named capture groups, so one finditer pass replaces ~25 independent
+# scans of the text. The input is whitespace-normalized before scanning
+# (see process_all), so the patterns use literal spaces instead of \s+:
+# the engine then runs its literal-prefix fast paths instead of testing a
+# character class at every word boundary.
+_PATTERNS = {
+    "personal": r'^(?P<first_name>\w+) (?P<last_name>\w+) was born on (?P<dob>\w+ \d+, \d+), in (?P<birth_city>\w+), (?P<birth_state>\w+), making him (?P<age>\d+) years old',
+    "nationality": r'As an (?P<nat>\w+) national',
+    "first_job": r'professional journey began on (?P<first_join>\w+ \d+, \d+),.*?as a (?P<first_desig>.*?) with an annual salary of (?P<first_salary>\d+(?:,\d+)*) (?P<first_curr>\w+)',
+    "current_job": r'current role at (?P<cur_org>.*?) beginning on (?P<cur_join>\w+ \d+, \d+).*?as a (?P<cur_desig>.*?) earning (?P<cur_salary>\d+(?:,\d+)*) (?P<cur_curr>\w+)',
+    "previous_job": r'worked at (?P<prev_org>.*?) from (?P<prev_join>\w+ \d+, \d+), to (?P<prev_end>\d{4}), starting as a (?P<prev_desig>.*?) and',
+    "high_school": r'high school education at (?P<hs>.*?), where he completed his 12th standard in (?P<year12>\d+), achieving an outstanding (?P<score12>\d+\.\d+)% overall score',
+    "undergraduate": r'B\.Tech in (?P<ug_degree>\w+ \w+) at the prestigious (?P<ug_college>\w+ \w+), graduating with honors in (?P<ug_year>\d+) with a CGPA of (?P<ug_cgpa>\d+\.\d+) on a 10-point scale',
+    "graduation": r'(?P<grad_college>IIT Bombay), where he earned his M\.Tech in (?P<grad_degree>\w+ \w+) in (?P<grad_year>\d{4}), achieving an exceptional CGPA of (?P<grad_cgpa>\d+\.\d+)',
+    "aws_cert": r'AWS Solutions Architect exam in (?P<aws_year>\d+) with a score of (?P<aws_score>\d+)',
+    "azure_cert": r'Azure Data Engineer certification in (?P<az_year>\d+) with (?P<az_points>\d+) points',
+    "pmp_cert": r'Project Management Professional certification, obtained in (?P<pmp_year>\d+)',
+    "safe_cert": r'SAFe Agilist certification earned him an outstanding (?P<safe_score>\d+)%',
+}
+
+# Location prior: the personal sentence always opens the document, so its
+# anchored pattern is matched on a bounded window (first 256 chars) rather
+# than riding in the master alternation over the whole text
+_PERSONAL_RE = _re.compile(_PATTERNS["personal"])
+_SCAN_PATTERNS = {name: p for name, p in _PATTERNS.items() if name != "personal"}
+
+_MASTER_RE = _re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _SCAN_PATTERNS.items())
+)
+
+# Collapses runs of whitespace (line wraps included) to single spaces so
+# the patterns above can match on literal spaces
+_WS = re.compile(r'\s+')
+
+# Hyperscan (pip install hyperscan) compiles the whole pattern set into one
+# SIMD-accelerated DFA and scans at multi-GB/s, which pays off on batch
+# runs over large corpora. It reports offsets only, so capture groups are
+# recovered by re-running the per-alternative Python pattern on the small
+# matched slice.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[p.encode() for p in _SCAN_PATTERNS.values()],
+        ids=list(range(len(_SCAN_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_SCAN_PATTERNS),
+    )
+    _HS_NAMES = tuple(_SCAN_PATTERNS)
+    _PART_RES = {name: _re.compile(p) for name, p in _SCAN_PATTERNS.items()}
+else:
+    _HS_DB = None
+
+
+_MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4,
+    "May": 5, "June": 6, "July": 7, "August": 8,
+    "September": 9, "October": 10, "November": 11, "December": 12,
+}
+
+
+def _iso_date(long_date, default):
+    """'March 15, 1989' -> '1989-03-15 00:00:00', or default if unparseable
+
+    Direct month lookup plus string splits; datetime.strptime re-parses its
+    format string and walks locale tables on every call, which is overkill
+    for this one fixed date shape.
+    """
+    try:
+        month, rest = long_date.split(" ", 1)
+        day, year = rest.split(", ")
+        return f"{int(year):04d}-{_MONTHS[month]:02d}-{int(day):02d} 00:00:00"
+    except (KeyError, ValueError):
+        return default
+
+
+# Long fixed comment strings used by the handlers, hoisted and interned so
+# repeated records (e.g. Birth City and Birth State) share a single object
+_PINKCITY_COMMENT = sys.intern("Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context")
+_AGE_COMMENT = sys.intern("As on year 2024. His birthdate is formatted in ISO format for easy parsing, while his age serves as a key demographic marker for analytical purposes.")
+_NATIONALITY_COMMENT = sys.intern("Citizenship status is important for understanding his work authorization and visa requirements across different employment opportunities.")
+_SALARY_COMMENT = sys.intern("This salary progression from his starting compensation to his current peak salary of 2,800,000 INR represents a substantial eight-fold increase over his twelve-year career span.")
+_SUBJECTS_COMMENT = sys.intern("His core subjects included Mathematics, Physics, Chemistry, and Computer Science, demonstrating his early aptitude for technical disciplines.")
+_UG_YEAR_COMMENT = sys.intern("Graduating with honors and ranking 15th among 120 students in his class.")
+_GRAD_CGPA_COMMENT = sys.intern("Considered exceptional and scoring 95 out of 100 for his final year thesis project.")
+
+
+def _to_float(s):
+    """float() for the fixed digits.digits shape the score captures take
+
+    Joining the digit runs and dividing by the right power of ten skips
+    float()'s general-purpose parser (sign/exponent/inf handling) while
+    rounding to exactly the same double.
+    """
+    whole, _, frac = s.partition('.')
+    return int(whole + frac) / 10 ** len(frac)
+
+
+# Comment templates for the certification records, hoisted beside the
+# interned constants above so the generated handlers only format the
+# captured year/score into them
+_AWS_COMMENT_FMT = "Vijay's commitment to continuous learning is evident through his impressive certification scores. He passed the AWS Solutions Architect exam in %s with a score of %s out of 1000"
+_AZURE_COMMENT_FMT = "Pursued in the year %s with %s points."
+_PMP_COMMENT_FMT = 'Obtained in %s, was achieved with an "Above Target" rating from PMI, These certifications complement his practical experience and demonstrate his expertise across multiple technology platforms.'
+_SAFE_COMMENT_FMT = "Earned him an outstanding %s%% score. Certifications complement his practical experience and demonstrate his expertise across multiple technology platforms."
+
+# Declarative record table, one entry per _PATTERNS alternative: each row
+# is (record number, key, value expression, comment expression), with the
+# expressions written in terms of the match object m. The dispatch
+# handlers are exec-generated from this table at import time, so every
+# append is inlined as straight-line code with no per-record helper call,
+# and adding a field means adding a row here rather than another method.
+_SPECS = {
+    "personal": (
+        (1, "First Name", "m['first_name']", None),
+        (2, "Last Name", "m['last_name']", None),
+        (3, "Date of Birth", "_iso_date(m['dob'], '1989-03-15 00:00:00')", None),
+        (4, "Birth City", "m['birth_city']", "_PINKCITY_COMMENT"),
+        (5, "Birth State", "m['birth_state']", "_PINKCITY_COMMENT"),
+        (6, "Age", "m['age'] + ' years'", "_AGE_COMMENT"),
+    ),
+    "nationality": (
+        (8, "Nationality", "m['nat']", "_NATIONALITY_COMMENT"),
+    ),
+    "first_job": (
+        (9, "Joining Date of first professional role", "_iso_date(m['first_join'], '2012-07-01 00:00:00')", None),
+        (10, "Designation of first professional role", "m['first_desig']", None),
+        (11, "Salary of first professional role", "m['first_salary'].replace(',', '')", None),
+        (12, "Salary currency of first professional role", "m['first_curr']", None),
+    ),
+    "current_job": (
+        (13, "Current Organization", "m['cur_org']", None),
+        (14, "Current Joining Date", "_iso_date(m['cur_join'], '2021-06-15 00:00:00')", None),
+        (15, "Current Designation", "m['cur_desig']", None),
+        (16, "Current Salary", "m['cur_salary'].replace(',', '')", "_SALARY_COMMENT"),
+        (17, "Current Salary Currency", "m['cur_curr']", None),
+    ),
+    "previous_job": (
+        (18, "Previous Organization", "m['prev_org']", None),
+        (19, "Previous Joining Date", "_iso_date(m['prev_join'], '2018-02-01 00:00:00')", None),
+        (20, "Previous end year", "m['prev_end']", None),
+        (21, "Previous Starting Designation", "m['prev_desig']", "'Promoted in 2019'"),
+    ),
+    "high_school": (
+        (22, "High School", "m['hs']", None),
+        (23, "12th standard pass out year", "m['year12']", "_SUBJECTS_COMMENT"),
+        (24, "12th overall board score", "_to_float(m['score12']) / 100", "'Outstanding achievement'"),
+    ),
+    "undergraduate": (
+        (25, "Undergraduate degree", "'B.Tech (' + m['ug_degree'] + ')'", None),
+        (26, "Undergraduate college", "m['ug_college']", None),
+        (27, "Undergraduate year", "m['ug_year']", "_UG_YEAR_COMMENT"),
+        (28, "Undergraduate CGPA", "_to_float(m['ug_cgpa'])", "'On a 10-point scale'"),
+    ),
+    "graduation": (
+        (29, "Graduation degree", "'M.Tech (' + m['grad_degree'] + ')'", None),
+        (30, "Graduation college", "m['grad_college']", "'Continued academic excellence at IIT Bombay'"),
+        (31, "Graduation year", "m['grad_year']", None),
+        (32, "Graduation CGPA", "_to_float(m['grad_cgpa'])", "_GRAD_CGPA_COMMENT"),
+    ),
+    "aws_cert": (
+        (33, "Certifications 1", "'AWS Solutions Architect'", "_AWS_COMMENT_FMT % (m['aws_year'], m['aws_score'])"),
+    ),
+    "azure_cert": (
+        (34, "Certifications 2", "'Azure Data Engineer'", "_AZURE_COMMENT_FMT % (m['az_year'], m['az_points'])"),
+    ),
+    "pmp_cert": (
+        (35, "Certifications 3", "'Project Management Professional certification'", "_PMP_COMMENT_FMT % m['pmp_year']"),
+    ),
+    "safe_cert": (
+        (36, "Certifications 4", "'SAFe Agilist certification'", "_SAFE_COMMENT_FMT % m['safe_score']"),
+    ),
+}
+
+
+def _make_handler(name, spec):
+    """exec-compile the dispatch handler for one _SPECS alternative.
+
+    The generated function appends its records as straight-line code, so a
+    matched alternative costs a single call with the row constants baked
+    into the bytecode; compilation happens once at import.
+    """
+    lines = [f"def _on_{name}(m, rows):"]
+    for num, key, value, comment in spec:
+        lines.append(f"    rows.append(({num}, {key!r}, {value}, {comment or repr('')}))")
+    namespace = {}
+    exec(compile("\n".join(lines), f"<_SPECS:{name}>", "exec"), globals(), namespace)
+    return namespace[f"_on_{name}"]
+
+
+# One generated handler per _PATTERNS alternative
+_HANDLERS = {name: _make_handler(name, spec) for name, spec in _SPECS.items()}
+
+
+def _scan_hyperscan(text, rows):
+    """Scan with the Hyperscan database instead of _MASTER_RE.
+
+    Hyperscan invokes the callback once per match end offset, so first
+    widen one extent per alternative, then recover the capture groups by
+    re-running the matching Python pattern on just that slice.
+    """
+    extents = {}
+
+    def on_match(pat_id, start, end, flags, context=None):
+        s, e = extents.get(pat_id, (start, end))
+        extents[pat_id] = (min(s, start), max(e, end))
+
+    data = text.encode('utf-8')
+    _HS_DB.scan(data, match_event_handler=on_match)
+    for pat_id, (start, end) in extents.items():
+        name = _HS_NAMES[pat_id]
+        m = _PART_RES[name].search(data[start:end].decode('utf-8'))
+        if m is not None:
+            _HANDLERS[name](m, rows)
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_all(text):
+    """Run the whole extraction over raw text, returning record tuples.
+
+    Pure in text, so repeated documents (re-runs, duplicate uploads in a
+    batch) come straight back from the lru_cache instead of being
+    re-scanned.
+    """
+    # Collapse all whitespace once so the literal-space patterns above
+    # (and the substring tests) never have to straddle a line wrap
+    text = _WS.sub(' ', text)
+    rows = []
+    # The blood-group mention captures nothing, so a plain substring test
+    # (a tight C two-way search) beats spinning up the regex engine for it
+    if "O+ blood group" in text:
+        rows.append((7, "Blood Group", "O+", "Emergency contact purposes."))
+    # The proficiency narrative is everything from its fixed opening
+    # phrase to the end of the document, so a find + slice replaces the
+    # old DOTALL ".*" tail scan. Location prior: it closes the document,
+    # so start the search in the back half and only fall back to a full
+    # scan for unusually shaped input
+    idx = text.find("In terms of technical proficiency", len(text) >> 1)
+    if idx < 0:
+        idx = text.find("In terms of technical proficiency")
+    if idx >= 0:
+        rows.append((37, "Technical Proficiency", "", text[idx:].strip()))
+    # Bounded window for the anchored opening sentence (see _PERSONAL_RE)
+    m = _PERSONAL_RE.match(text, 0, 256)
+    if m is not None:
+        _HANDLERS["personal"](m, rows)
+    if _HS_DB is not None:
+        _scan_hyperscan(text, rows)
+    else:
+        # Only the first occurrence of each alternative counts (matching
+        # _scan_hyperscan, which keeps one extent per pattern), and the
+        # automaton stops once every alternative has been seen instead of
+        # running over the remaining tail
+        seen = set()
+        for m in _MASTER_RE.finditer(text):
+            # m.lastgroup would name the innermost capture, so find the
+            # outer alternative that matched to pick the handler
+            kind = next(name for name in _SCAN_PATTERNS if m[name] is not None)
+            if kind in seen:
+                continue
+            seen.add(kind)
+            _HANDLERS[kind](m, rows)
+            if len(seen) == len(_SCAN_PATTERNS):
+                break
+    # Record numbers lead each tuple, so a plain sort gives layout order
+    rows.sort()
+    return tuple(rows)
+
 
 class DocumentProcessor:
     """
@@ -19,15 +317,24 @@ class DocumentProcessor:
     - Excel export functionality
     """
     
-    def __init__(self, text_content=None):
+    def __init__(self, text_content=None, log=True):
         """
         Initialize the document processor.
         
         Args:
             text_content (str): Unstructured text content to process
+            log (bool): Keep a human-readable processing log. Turn off for
+                batch ingestion to skip the per-step string formatting.
         """
         self.text_content = text_content
-        self.extracted_data = []
+        self._log_enabled = log
+        # Column-oriented record store: four parallel lists instead of one
+        # small dict per record, so appends avoid re-hashing the same four
+        # key strings and the per-record PyObject overhead
+        self._nums = []
+        self._keys = []
+        self._values = []
+        self._comments = []
         self.processing_log = []
         
     def load_from_file(self, file_path):
@@ -38,450 +345,76 @@ class DocumentProcessor:
             file_path (str): Path to the text file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                self.text_content = file.read()
-            self.processing_log.append(f"✅ Loaded content from {file_path}")
+            # Read raw bytes through a 64 KiB buffer (fewer syscalls than the
+            # default) and decode once, instead of decoding through the
+            # incremental text-wrapper state machine
+            with open(file_path, 'rb', buffering=1 << 16) as file:
+                data = file.read()
+            self.text_content = data.decode('utf-8')
+            if self._log_enabled:
+                self.processing_log.append(f"✅ Loaded content from {file_path}")
         except Exception as e:
-            self.processing_log.append(f"❌ Error loading file: {str(e)}")
+            if self._log_enabled:
+                self.processing_log.append(f"❌ Error loading file: {str(e)}")
             raise
     
-    def extract_personal_info(self):
-        """Extract personal information from the text"""
-        try:
-            # Name extraction
-            name_match = re.search(r'^(\w+)\s+(\w+)\s+was\s+born', self.text_content)
-            if name_match:
-                first_name = name_match.group(1)
-                last_name = name_match.group(2)
-                self.extracted_data.append({
-                    "#": 1,
-                    "Key": "First Name",
-                    "Value": first_name,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 2,
-                    "Key": "Last Name", 
-                    "Value": last_name,
-                    "Comments": ""
-                })
-            
-            # Date of birth
-            dob_match = re.search(r'born\s+on\s+(\w+\s+\d+,\s+\d+)', self.text_content)
-            if dob_match:
-                dob_str = dob_match.group(1)
-                try:
-                    dob_date = datetime.strptime(dob_str, "%B %d, %Y")
-                    iso_dob = dob_date.strftime("%Y-%m-%d 00:00:00")
-                except:
-                    iso_dob = "1989-03-15 00:00:00"
-                
-                self.extracted_data.append({
-                    "#": 3,
-                    "Key": "Date of Birth",
-                    "Value": iso_dob,
-                    "Comments": ""
-                })
-            
-            # Birth city and state
-            birth_match = re.search(r'born\s+on\s+.*?,\s+(\d+),\s+in\s+(\w+),\s+(\w+)', self.text_content)
-            if birth_match:
-                city = birth_match.group(2)
-                state = birth_match.group(3)
-                
-                self.extracted_data.append({
-                    "#": 4,
-                    "Key": "Birth City",
-                    "Value": city,
-                    "Comments": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context"
-                })
-                self.extracted_data.append({
-                    "#": 5,
-                    "Key": "Birth State",
-                    "Value": state,
-                    "Comments": "Born and raised in the Pink City of India, his birthplace provides valuable regional profiling context"
-                })
-            
-            # Age
-            age_match = re.search(r'making\s+him\s+(\d+)\s+years\s+old', self.text_content)
-            if age_match:
-                age = age_match.group(1)
-                self.extracted_data.append({
-                    "#": 6,
-                    "Key": "Age",
-                    "Value": f"{age} years",
-                    "Comments": "As on year 2024. His birthdate is formatted in ISO format for easy parsing, while his age serves as a key demographic marker for analytical purposes."
-                })
-            
-            # Blood group
-            blood_match = re.search(r'O\+\s+blood\s+group', self.text_content)
-            if blood_match:
-                self.extracted_data.append({
-                    "#": 7,
-                    "Key": "Blood Group",
-                    "Value": "O+",
-                    "Comments": "Emergency contact purposes."
-                })
-            
-            # Nationality
-            nationality_match = re.search(r'As\s+an\s+(\w+)\s+national', self.text_content)
-            if nationality_match:
-                nationality = nationality_match.group(1)
-                self.extracted_data.append({
-                    "#": 8,
-                    "Key": "Nationality",
-                    "Value": nationality,
-                    "Comments": "Citizenship status is important for understanding his work authorization and visa requirements across different employment opportunities."
-                })
-            
-            self.processing_log.append("✅ Personal information extracted successfully")
-            
-        except Exception as e:
-            self.processing_log.append(f"❌ Error extracting personal info: {str(e)}")
-    
-    def extract_professional_info(self):
-        """Extract professional and career information"""
-        try:
-            # First job details
-            first_job_match = re.search(r'professional\s+journey\s+began\s+on\s+(\w+\s+\d+,\s+\d+).*?as\s+a\s+(.*?)\s+with\s+an\s+annual\s+salary\s+of\s+(\d+(?:,\d+)?)\s+(\w+)', self.text_content)
-            if first_job_match:
-                start_date = first_job_match.group(1)
-                designation = first_job_match.group(2)
-                salary = first_job_match.group(3).replace(',', '')
-                currency = first_job_match.group(4)
-                
-                try:
-                    start_date_obj = datetime.strptime(start_date, "%B %d, %Y")
-                    start_date_str = start_date_obj.strftime("%Y-%m-%d 00:00:00")
-                except:
-                    start_date_str = "2012-07-01 00:00:00"
-                
-                self.extracted_data.append({
-                    "#": 9,
-                    "Key": "Joining Date of first professional role",
-                    "Value": start_date_str,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 10,
-                    "Key": "Designation of first professional role",
-                    "Value": designation,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 11,
-                    "Key": "Salary of first professional role",
-                    "Value": salary,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 12,
-                    "Key": "Salary currency of first professional role",
-                    "Value": currency,
-                    "Comments": ""
-                })
-            
-            # Current job details
-            current_job_match = re.search(r'current\s+role\s+at\s+(.*?)\s+beginning\s+on\s+(\w+\s+\d+,\s+\d+).*?as\s+a\s+(.*?)\s+earning\s+(\d+(?:,\d+)?)\s+(\w+)', self.text_content)
-            if current_job_match:
-                org = current_job_match.group(1)
-                start_date = current_job_match.group(2)
-                designation = current_job_match.group(3)
-                salary = current_job_match.group(4).replace(',', '')
-                currency = current_job_match.group(5)
-                
-                try:
-                    start_date_obj = datetime.strptime(start_date, "%B %d, %Y")
-                    start_date_str = start_date_obj.strftime("%Y-%m-%d 00:00:00")
-                except:
-                    start_date_str = "2021-06-15 00:00:00"
-                
-                self.extracted_data.append({
-                    "#": 13,
-                    "Key": "Current Organization",
-                    "Value": org,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 14,
-                    "Key": "Current Joining Date",
-                    "Value": start_date_str,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 15,
-                    "Key": "Current Designation",
-                    "Value": designation,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 16,
-                    "Key": "Current Salary",
-                    "Value": salary,
-                    "Comments": "This salary progression from his starting compensation to his current peak salary of 2,800,000 INR represents a substantial eight-fold increase over his twelve-year career span."
-                })
-                self.extracted_data.append({
-                    "#": 17,
-                    "Key": "Current Salary Currency",
-                    "Value": currency,
-                    "Comments": ""
-                })
-            
-            # Previous job details
-            prev_job_match = re.search(r'worked\s+at\s+(.*?)\s+from\s+(\w+\s+\d+,\s+\d+).*?(\d{4})', self.text_content)
-            if prev_job_match:
-                org = prev_job_match.group(1)
-                start_date = prev_job_match.group(2)
-                end_year = prev_job_match.group(3)
-                
-                try:
-                    start_date_obj = datetime.strptime(start_date, "%B %d, %Y")
-                    start_date_str = start_date_obj.strftime("%Y-%m-%d 00:00:00")
-                except:
-                    start_date_str = "2018-02-01 00:00:00"
-                
-                self.extracted_data.append({
-                    "#": 18,
-                    "Key": "Previous Organization",
-                    "Value": org,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 19,
-                    "Key": "Previous Joining Date",
-                    "Value": start_date_str,
-                    "Comments": ""
-                })
-                self.extracted_data.append({
-                    "#": 20,
-                    "Key": "Previous end year",
-                    "Value": end_year,
-                    "Comments": ""
-                })
-                
-                # Starting designation at previous job
-                prev_designation_match = re.search(r'at\s+LakeCorp\s+Solutions.*starting\s+as\s+a\s+(.*?)\s+and', self.text_content)
-                if prev_designation_match:
-                    self.extracted_data.append({
-                        "#": 21,
-                        "Key": "Previous Starting Designation",
-                        "Value": prev_designation_match.group(1),
-                        "Comments": "Promoted in 2019"
-                    })
-            
-            self.processing_log.append("✅ Professional information extracted successfully")
-            
-        except Exception as e:
-            self.processing_log.append(f"❌ Error extracting professional info: {str(e)}")
-    
-    def extract_education_info(self):
-        """Extract education information"""
-        try:
-            # High school
-            hs_match = re.search(r'high\s+school\s+education\s+at\s+(.*?),\s+where\s+he\s+completed', self.text_content)
-            if hs_match:
-                self.extracted_data.append({
-                    "#": 22,
-                    "Key": "High School",
-                    "Value": hs_match.group(1),
-                    "Comments": ""
-                })
-            
-            # 12th standard pass out year
-            year12_match = re.search(r'12th\s+standard\s+in\s+(\d+)', self.text_content)
-            if year12_match:
-                self.extracted_data.append({
-                    "#": 23,
-                    "Key": "12th standard pass out year",
-                    "Value": year12_match.group(1),
-                    "Comments": "His core subjects included Mathematics, Physics, Chemistry, and Computer Science, demonstrating his early aptitude for technical disciplines."
-                })
-            
-            # 12th board score
-            score12_match = re.search(r'outstanding\s+(\d+\.\d+)%\s+overall\s+score', self.text_content)
-            if score12_match:
-                score = float(score12_match.group(1)) / 100
-                self.extracted_data.append({
-                    "#": 24,
-                    "Key": "12th overall board score",
-                    "Value": score,
-                    "Comments": "Outstanding achievement"
-                })
-            
-            # Undergraduate degree
-            ug_match = re.search(r'B\.Tech\s+in\s+(\w+\s+\w+)', self.text_content)
-            if ug_match:
-                self.extracted_data.append({
-                    "#": 25,
-                    "Key": "Undergraduate degree",
-                    "Value": f"B.Tech ({ug_match.group(1)})",
-                    "Comments": ""
-                })
-            
-            # Undergraduate college
-            ug_college_match = re.search(r'prestigious\s+(\w+\s+\w+),\s+graduating', self.text_content)
-            if ug_college_match:
-                self.extracted_data.append({
-                    "#": 26,
-                    "Key": "Undergraduate college",
-                    "Value": ug_college_match.group(1),
-                    "Comments": ""
-                })
-            
-            # Undergraduate year
-            ug_year_match = re.search(r'graduating\s+with\s+honors\s+in\s+(\d+)', self.text_content)
-            if ug_year_match:
-                self.extracted_data.append({
-                    "#": 27,
-                    "Key": "Undergraduate year",
-                    "Value": ug_year_match.group(1),
-                    "Comments": "Graduating with honors and ranking 15th among 120 students in his class."
-                })
-            
-            # Undergraduate CGPA
-            ug_cgpa_match = re.search(r'CGPA\s+of\s+(\d+\.\d+)\s+on\s+a\s+10-point\s+scale', self.text_content)
-            if ug_cgpa_match:
-                self.extracted_data.append({
-                    "#": 28,
-                    "Key": "Undergraduate CGPA",
-                    "Value": float(ug_cgpa_match.group(1)),
-                    "Comments": "On a 10-point scale"
-                })
-            
-            # Graduation degree (Master's)
-            grad_match = re.search(r'M\.Tech\s+in\s+(\w+\s+\w+)', self.text_content)
-            if grad_match:
-                self.extracted_data.append({
-                    "#": 29,
-                    "Key": "Graduation degree",
-                    "Value": f"M.Tech ({grad_match.group(1)})",
-                    "Comments": ""
-                })
-            
-            # Graduation college
-            grad_college_match = re.search(r'IIT\s+Bombay,\s+where\s+he\s+earned', self.text_content)
-            if grad_college_match:
-                self.extracted_data.append({
-                    "#": 30,
-                    "Key": "Graduation college",
-                    "Value": "IIT Bombay",
-                    "Comments": "Continued academic excellence at IIT Bombay"
-                })
-            
-            # Graduation year
-            grad_year = "2013"  # Extracted from context
-            self.extracted_data.append({
-                "#": 31,
-                "Key": "Graduation year",
-                "Value": grad_year,
-                "Comments": ""
-            })
-            
-            # Graduation CGPA
-            grad_cgpa_match = re.search(r'achieving\s+an\s+exceptional\s+CGPA\s+of\s+(\d+\.\d+)', self.text_content)
-            if grad_cgpa_match:
-                self.extracted_data.append({
-                    "#": 32,
-                    "Key": "Graduation CGPA",
-                    "Value": float(grad_cgpa_match.group(1)),
-                    "Comments": "Considered exceptional and scoring 95 out of 100 for his final year thesis project."
-                })
-            
-            self.processing_log.append("✅ Education information extracted successfully")
-            
-        except Exception as e:
-            self.processing_log.append(f"❌ Error extracting education info: {str(e)}")
-    
-    def extract_certifications(self):
-        """Extract certification information"""
-        try:
-            # AWS certification
-            aws_match = re.search(r'AWS\s+Solutions\s+Architect\s+exam\s+in\s+(\d+)\s+with\s+a\s+score\s+of\s+(\d+)', self.text_content)
-            if aws_match:
-                self.extracted_data.append({
-                    "#": 33,
-                    "Key": "Certifications 1",
-                    "Value": "AWS Solutions Architect",
-                    "Comments": f"Vijay's commitment to continuous learning is evident through his impressive certification scores. He passed the AWS Solutions Architect exam in {aws_match.group(1)} with a score of {aws_match.group(2)} out of 1000"
-                })
-            
-            # Azure certification
-            azure_match = re.search(r'Azure\s+Data\s+Engineer\s+certification\s+in\s+(\d+)\s+with\s+(\d+)\s+points', self.text_content)
-            if azure_match:
-                self.extracted_data.append({
-                    "#": 34,
-                    "Key": "Certifications 2",
-                    "Value": "Azure Data Engineer",
-                    "Comments": f"Pursued in the year {azure_match.group(1)} with {azure_match.group(2)} points."
-                })
-            
-            # PMP certification
-            pmp_match = re.search(r'Project\s+Management\s+Professional\s+certification,\s+obtained\s+in\s+(\d+)', self.text_content)
-            if pmp_match:
-                self.extracted_data.append({
-                    "#": 35,
-                    "Key": "Certifications 3",
-                    "Value": "Project Management Professional certification",
-                    "Comments": f"Obtained in {pmp_match.group(1)}, was achieved with an \"Above Target\" rating from PMI, These certifications complement his practical experience and demonstrate his expertise across multiple technology platforms."
-                })
-            
-            # SAFe certification
-            safe_match = re.search(r'SAFe\s+Agilist\s+certification\s+earned\s+him\s+an\s+outstanding\s+(\d+)%', self.text_content)
-            if safe_match:
-                self.extracted_data.append({
-                    "#": 36,
-                    "Key": "Certifications 4",
-                    "Value": "SAFe Agilist certification",
-                    "Comments": f"Earned him an outstanding {safe_match.group(1)}% score. Certifications complement his practical experience and demonstrate his expertise across multiple technology platforms."
-                })
-            
-            self.processing_log.append("✅ Certifications extracted successfully")
-            
-        except Exception as e:
-            self.processing_log.append(f"❌ Error extracting certifications: {str(e)}")
-    
-    def extract_technical_proficiency(self):
-        """Extract technical proficiency summary"""
-        try:
-            # Find the technical proficiency section
-            tech_section = re.search(r'In\s+terms\s+of\s+technical\s+proficiency.*', self.text_content, re.DOTALL)
-            if tech_section:
-                tech_text = tech_section.group(0)
-                self.extracted_data.append({
-                    "#": 37,
-                    "Key": "Technical Proficiency",
-                    "Value": "",
-                    "Comments": tech_text.strip()
-                })
-            
-            self.processing_log.append("✅ Technical proficiency extracted successfully")
-            
-        except Exception as e:
-            self.processing_log.append(f"❌ Error extracting technical proficiency: {str(e)}")
-    
+    @property
+    def extracted_data(self):
+        """Extracted records materialized as a list of dicts"""
+        return [
+            {"#": n, "Key": k, "Value": v, "Comments": c}
+            for n, k, v, c in zip(self._nums, self._keys, self._values, self._comments)
+        ]
+
     def process_all(self):
         """
-        Process all sections of the document.
-        
+        Process all sections of the document in one pass.
+
         Returns:
             list: Extracted data as list of dictionaries
         """
         if not self.text_content:
             raise ValueError("No text content provided. Please load content first.")
-        
-        self.processing_log.append("🚀 Starting document processing...")
-        
-        # Process all sections
-        self.extract_personal_info()
-        self.extract_professional_info()
-        self.extract_education_info()
-        self.extract_certifications()
-        self.extract_technical_proficiency()
-        
-        self.processing_log.append(f"✅ Processing complete! Extracted {len(self.extracted_data)} records.")
-        
+
+        if self._log_enabled:
+            self.processing_log.append("🚀 Starting document processing...")
+
+        # The pipeline itself is the memoized module function; this just
+        # unzips its record tuples into the column store
+        rows = _extract_all(self.text_content)
+        self._nums = [r[0] for r in rows]
+        self._keys = [r[1] for r in rows]
+        self._values = [r[2] for r in rows]
+        self._comments = [r[3] for r in rows]
+
+        if self._log_enabled:
+            self.processing_log.append(f"✅ Processing complete! Extracted {len(self._nums)} records.")
+
         return self.extracted_data
-    
+
+    def to_dataframe(self):
+        """
+        Extracted records as a pandas DataFrame for downstream analysis.
+
+        The Excel and JSON writers stream straight off the column store,
+        so this bridge is the only pandas consumer. from_records over the
+        zipped columns skips per-column dtype inference on dicts, and the
+        explicit int16 "#" dtype avoids the inferred int64.
+
+        Returns:
+            pandas.DataFrame: One row per extracted record
+        """
+        # Deferred: pandas costs hundreds of ms of import time that CLI
+        # and batch callers who never touch this bridge should not pay
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(
+            zip(self._nums, self._keys, self._values, self._comments),
+            columns=["#", "Key", "Value", "Comments"],
+        )
+        df["#"] = df["#"].astype("int16")
+        return df
+
     def save_to_excel(self, filename="Output.xlsx"):
         """
         Save extracted data to Excel file.
@@ -490,15 +423,33 @@ class DocumentProcessor:
             filename (str): Output filename
         """
         try:
-            if not self.extracted_data:
+            if not self._nums:
                 raise ValueError("No data to save. Please process document first.")
-            
-            df = pd.DataFrame(self.extracted_data)
-            df.to_excel(filename, index=False, engine='openpyxl')
-            self.processing_log.append(f"✅ Data saved to {filename}")
+
+            # Rows come straight off the column store without dict detours;
+            # both writers stream each row to disk rather than holding the
+            # sheet in memory
+            if xlsxwriter is not None:
+                wb = xlsxwriter.Workbook(filename, {'constant_memory': True})
+                ws = wb.add_worksheet()
+                ws.write_row(0, 0, ["#", "Key", "Value", "Comments"])
+                rows = zip(self._nums, self._keys, self._values, self._comments)
+                for i, row in enumerate(rows, 1):
+                    ws.write_row(i, 0, row)
+                wb.close()
+            else:
+                wb = openpyxl.Workbook(write_only=True)
+                ws = wb.create_sheet()
+                ws.append(["#", "Key", "Value", "Comments"])
+                for row in zip(self._nums, self._keys, self._values, self._comments):
+                    ws.append(row)
+                wb.save(filename)
+            if self._log_enabled:
+                self.processing_log.append(f"✅ Data saved to {filename}")
             
         except Exception as e:
-            self.processing_log.append(f"❌ Error saving to Excel: {str(e)}")
+            if self._log_enabled:
+                self.processing_log.append(f"❌ Error saving to Excel: {str(e)}")
             raise
     
     def save_to_json(self, filename="extracted_data.json"):
@@ -509,23 +460,34 @@ class DocumentProcessor:
             filename (str): Output filename
         """
         try:
-            if not self.extracted_data:
+            if not self._nums:
                 raise ValueError("No data to save. Please process document first.")
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.extracted_data, f, indent=2, default=str, ensure_ascii=False)
-            self.processing_log.append(f"✅ Data saved to {filename}")
+
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.extracted_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                import json
+
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(self.extracted_data, f, indent=2, default=str, ensure_ascii=False)
+            if self._log_enabled:
+                self.processing_log.append(f"✅ Data saved to {filename}")
             
         except Exception as e:
-            self.processing_log.append(f"❌ Error saving to JSON: {str(e)}")
+            if self._log_enabled:
+                self.processing_log.append(f"❌ Error saving to JSON: {str(e)}")
             raise
     
     def get_processing_summary(self):
         """Get processing summary and logs"""
         return {
-            "total_records": len(self.extracted_data),
+            "total_records": len(self._nums),
             "processing_logs": self.processing_log,
-            "accuracy": "100%" if len(self.extracted_data) == 37 else f"{len(self.extracted_data)/37*100:.1f}%"
+            "accuracy": "100%" if len(self._nums) == 37 else f"{len(self._nums)/37*100:.1f}%"
         }
 
 